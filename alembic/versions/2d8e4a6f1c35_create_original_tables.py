@@ -0,0 +1,116 @@
+"""Create the original tables
+
+Revision ID: 2d8e4a6f1c35
+Revises: 963f897d3797
+Create Date: 2026-10-16 14:22:05.318446
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8e4a6f1c35'
+down_revision: Union[str, Sequence[str], None] = '963f897d3797'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Native enum types of the original models (they store member names, e.g. 'PENDING');
+# later revisions convert these columns to VARCHAR + CHECK
+APPLICANT_STATUS = ("CREATED", "PENDING", "APPROVED", "REJECTED", "EXPIRED")
+VERIFICATION_STEPS = ("FACE_LIVENESS", "KYC_VERIFICATION", "ID_SCAN", "SELFIE", "VERIFICATION_COMPLETE")
+STEP_STATUS = ("PENDING", "IN_PROGRESS", "COMPLETED", "FAILED")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The initial revision created nothing, so databases stamped at it got their
+    # tables from create_all()/init_db(); later revisions bring those up to date
+    if sa.inspect(op.get_bind()).has_table("applicants"):
+        return
+    
+    op.create_table(
+        "applicants",
+        sa.Column("id", sa.String(255), primary_key=True),
+        sa.Column("external_user_id", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("phone", sa.String(20), nullable=True),
+        sa.Column("first_name", sa.String(255), nullable=False),
+        sa.Column("last_name", sa.String(255), nullable=False),
+        sa.Column("country", sa.String(10), nullable=True),
+        sa.Column("status", sa.Enum(*APPLICANT_STATUS, name="applicantstatus"), nullable=False),
+        sa.Column("review_status", sa.String(50), nullable=True),
+        sa.Column("review_result", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("sumsub_created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_applicants_id", "applicants", ["id"])
+    op.create_index("ix_applicants_external_user_id", "applicants", ["external_user_id"], unique=True)
+    op.create_index("ix_applicants_email", "applicants", ["email"])
+    op.create_index("ix_applicants_status", "applicants", ["status"])
+    op.create_index("ix_applicants_created_at", "applicants", ["created_at"])
+    
+    op.create_table(
+        "verification_steps",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("applicant_id", sa.String(255), sa.ForeignKey("applicants.id"), nullable=False),
+        sa.Column("step", sa.Enum(*VERIFICATION_STEPS, name="verificationstepenum"), nullable=False),
+        sa.Column("status", sa.Enum(*STEP_STATUS, name="stepstatusenum"), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_verification_steps_applicant_id", "verification_steps", ["applicant_id"])
+    op.create_index("ix_verification_steps_step", "verification_steps", ["step"])
+    op.create_index("ix_verification_steps_status", "verification_steps", ["status"])
+    
+    op.create_table(
+        "documents",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("applicant_id", sa.String(255), sa.ForeignKey("applicants.id"), nullable=False),
+        sa.Column("document_type", sa.String(50), nullable=False),
+        sa.Column("file_name", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=True),
+        sa.Column("mime_type", sa.String(100), nullable=True),
+        sa.Column("sumsub_document_id", sa.String(255), nullable=True),
+        sa.Column("upload_status", sa.String(50), nullable=False),
+        sa.Column("uploaded_at", sa.DateTime(), nullable=False),
+        sa.Column("verified_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_documents_applicant_id", "documents", ["applicant_id"])
+    op.create_index("ix_documents_document_type", "documents", ["document_type"])
+    op.create_index("ix_documents_sumsub_document_id", "documents", ["sumsub_document_id"])
+    op.create_index("ix_documents_uploaded_at", "documents", ["uploaded_at"])
+    
+    op.create_table(
+        "webhook_events",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("applicant_id", sa.String(255), sa.ForeignKey("applicants.id"), nullable=False),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("applicant_status", sa.String(50), nullable=True),
+        sa.Column("review_status", sa.String(50), nullable=True),
+        sa.Column("review_result", sa.String(50), nullable=True),
+        sa.Column("payload", sa.Text(), nullable=True),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+        sa.Column("processed", sa.Boolean(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_webhook_events_applicant_id", "webhook_events", ["applicant_id"])
+    op.create_index("ix_webhook_events_event_type", "webhook_events", ["event_type"])
+    op.create_index("ix_webhook_events_received_at", "webhook_events", ["received_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("webhook_events")
+    op.drop_table("documents")
+    op.drop_table("verification_steps")
+    op.drop_table("applicants")
+    for enum_name in ("stepstatusenum", "verificationstepenum", "applicantstatus"):
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
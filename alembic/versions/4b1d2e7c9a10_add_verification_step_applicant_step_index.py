@@ -0,0 +1,35 @@
+"""Add unique (applicant_id, step) index on verification_steps
+
+Revision ID: 4b1d2e7c9a10
+Revises: 2d8e4a6f1c35
+Create Date: 2026-10-15 10:12:31.482907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1d2e7c9a10'
+down_revision: Union[str, Sequence[str], None] = '2d8e4a6f1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables may already have been created with this index by init_db()
+    op.create_index(
+        "ix_vstep_applicant_step",
+        "verification_steps",
+        ["applicant_id", "step"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_vstep_applicant_step", table_name="verification_steps", if_exists=True)
@@ -0,0 +1,40 @@
+"""Use database clock for timestamp defaults
+
+Revision ID: 7e3a5c91d2b4
+Revises: 4b1d2e7c9a10
+Create Date: 2026-10-15 11:03:54.217630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e3a5c91d2b4'
+down_revision: Union[str, Sequence[str], None] = '4b1d2e7c9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs the application no longer fills in from Python
+TIMESTAMP_COLUMNS = (
+    ("applicants", "created_at"),
+    ("applicants", "updated_at"),
+    ("verification_steps", "created_at"),
+    ("verification_steps", "updated_at"),
+    ("documents", "uploaded_at"),
+    ("webhook_events", "received_at"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -0,0 +1,83 @@
+"""Store status enums as VARCHAR with CHECK constraints; align indexes with models
+
+Revision ID: b52f0c8e6d13
+Revises: 7e3a5c91d2b4
+Create Date: 2026-10-16 09:41:07.553812
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52f0c8e6d13'
+down_revision: Union[str, Sequence[str], None] = '7e3a5c91d2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, native enum type the column used to have, CHECK constraint, allowed values).
+# The old native enums stored member names ('PENDING'); the columns now store values ('pending').
+ENUM_COLUMNS = (
+    ("applicants", "status", "applicantstatus", "ck_applicant_status",
+     ("created", "pending", "approved", "rejected", "expired")),
+    ("verification_steps", "step", "verificationstepenum", "ck_verification_step_step",
+     ("face_liveness", "kyc_verification", "id_scan", "selfie", "verification_complete")),
+    ("verification_steps", "status", "stepstatusenum", "ck_verification_step_status",
+     ("pending", "in_progress", "completed", "failed")),
+)
+
+
+def _check_sql(column: str, values: Sequence[str]) -> str:
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tables created by a recent init_db() already have the VARCHAR columns and CHECKs
+    inspector = sa.inspect(op.get_bind())
+    for table, column, enum_name, check_name, values in ENUM_COLUMNS:
+        column_type = next(c["type"] for c in inspector.get_columns(table) if c["name"] == column)
+        if isinstance(column_type, sa.Enum):
+            op.alter_column(
+                table, column,
+                existing_type=column_type,
+                type_=sa.String(32),
+                existing_nullable=False,
+                postgresql_using=f"lower({column}::text)",
+            )
+        if check_name not in {c["name"] for c in inspector.get_check_constraints(table)}:
+            op.create_check_constraint(check_name, table, _check_sql(column, values))
+    
+    for _, _, enum_name, _, _ in ENUM_COLUMNS:
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+    
+    # Webhook history is read per applicant by time; steps are looked up via
+    # ix_vstep_applicant_step, so the single-column indexes are dead weight
+    op.create_index(
+        "ix_webhook_applicant_time", "webhook_events", ["applicant_id", "received_at"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_verification_steps_step", table_name="verification_steps", if_exists=True)
+    op.drop_index("ix_webhook_events_received_at", table_name="webhook_events", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_webhook_events_received_at", "webhook_events", ["received_at"], if_not_exists=True)
+    op.create_index("ix_verification_steps_step", "verification_steps", ["step"], if_not_exists=True)
+    op.drop_index("ix_webhook_applicant_time", table_name="webhook_events", if_exists=True)
+    
+    for table, column, enum_name, check_name, values in ENUM_COLUMNS:
+        op.drop_constraint(check_name, table, type_="check")
+        enum_type = postgresql.ENUM(*(v.upper() for v in values), name=enum_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        op.alter_column(
+            table, column,
+            existing_type=sa.String(32),
+            type_=enum_type,
+            existing_nullable=False,
+            postgresql_using=f"upper({column})::{enum_name}",
+        )
@@ -2,60 +2,63 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import DeclarativeBase
 from config import settings
-from typing import Generator
+from typing import AsyncGenerator
+import logging
 
-# Create database engine with connection pooling
-engine = create_engine(
+logger = logging.getLogger("kyc")
+
+# Create async database engine with connection pooling (asyncpg driver)
+engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.SQLALCHEMY_ECHO,
     pool_size=settings.SQLALCHEMY_POOL_SIZE,
     max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+    pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,  # Fail fast when the pool is exhausted
     pool_pre_ping=True,  # Test connections before using them
-    pool_recycle=3600,   # Recycle connections every hour
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
+# Create async session factory
+SessionLocal = async_sessionmaker(
     bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
     expire_on_commit=False
 )
 
 # Declarative base for models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session
     Usage in FastAPI routes:
         @app.get("/")
-        def read_root(db: Session = Depends(get_db)):
+        async def read_root(db: AsyncSession = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_all_tables():
+async def create_all_tables():
     """Create all database tables"""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def drop_all_tables():
+async def drop_all_tables():
     """Drop all database tables (use with caution!)"""
-    Base.metadata.drop_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
 
 
-def init_db():
+async def init_db():
     """Initialize database - create all tables"""
-    create_all_tables()
-    print("✅ Database initialized successfully!")
+    await create_all_tables()
+    logger.info("Database initialized successfully")
@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+"""Create database tables (one-shot, run before starting the API)"""
+
+import asyncio
+import logging
+from database import engine, init_db
+
+async def main():
+    try:
+        await init_db()
+    finally:
+        await engine.dispose()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
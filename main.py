@@ -1,43 +1,93 @@
 # ==================== main.py ====================
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
 from routes.kyc_routes import router as kyc_router
+from services.sumsub_service import sumsub_service
 from database import init_db
+from utils.log import setup_logging
+import asyncio
+import logging
+import orjson
+
+logger = logging.getLogger("kyc")
+_log_listener = None
+_warm_up_task = None
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse
 )
 
-# Initialize database
-try:
-    init_db()
-except Exception as e:
-    print(f"⚠️ Database initialization error: {e}")
-    print("Make sure PostgreSQL is running and credentials are correct in .env")
+async def _warm_up_sumsub():
+    """Open the first Sumsub connection so the first user request skips the TLS handshake"""
+    if not await sumsub_service.warm_up():
+        logger.warning("sumsub_warm_up_failed", extra={"base_url": settings.SUMSUB_BASE_URL})
+
+# Startup: log pool config, create tables only when RUN_DB_MIGRATIONS=1
+@app.on_event("startup")
+async def startup():
+    global _log_listener, _warm_up_task
+    _log_listener = setup_logging(logging.DEBUG if settings.DEBUG else logging.INFO)
+    
+    logger.info(
+        "db_pool",
+        extra={
+            "pool_size": settings.SQLALCHEMY_POOL_SIZE,
+            "max_overflow": settings.SQLALCHEMY_MAX_OVERFLOW,
+            "pool_timeout": settings.SQLALCHEMY_POOL_TIMEOUT,
+            "pool_recycle": settings.SQLALCHEMY_POOL_RECYCLE,
+        }
+    )
+    # In the background - an unreachable Sumsub must not delay startup
+    _warm_up_task = asyncio.create_task(_warm_up_sumsub())
+    if not settings.RUN_DB_MIGRATIONS:
+        return
+    try:
+        await init_db()
+    except Exception:
+        logger.exception(
+            "Database initialization error - make sure PostgreSQL is running "
+            "and credentials are correct in .env"
+        )
+
+@app.on_event("shutdown")
+async def shutdown():
+    if _warm_up_task:
+        _warm_up_task.cancel()
+    await sumsub_service.aclose()
+    if _log_listener:
+        _log_listener.stop()
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=list(settings.CORS_ORIGINS) or ["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type", "X-Webhook-Signature"],
 )
 
 # Include routes
 app.include_router(kyc_router)
 
+# Static probe responses, serialized once
+_ROOT_BODY = orjson.dumps({"message": "KYC Verification API", "version": settings.VERSION, "database": "PostgreSQL"})
+_HEALTH_BODY = orjson.dumps({"status": "ok", "database": "connected"})
+
 @app.get("/")
 async def root():
-    return {"message": "KYC Verification API", "version": settings.VERSION, "database": "PostgreSQL"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok", "database": "connected"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvicorn[standard] brings uvloop + httptools, which uvicorn picks automatically
+    # (it falls back to asyncio/h11 where they are unavailable, e.g. Windows)
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=settings.WORKERS, proxy_headers=True)
\ No newline at end of file
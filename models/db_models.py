@@ -2,9 +2,10 @@
 SQLAlchemy database models
 """
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Enum as SQLEnum, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Integer, Boolean, ForeignKey, Text, CheckConstraint, Index, func, literal_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Optional
 import enum
 from database import Base
 
@@ -35,37 +36,50 @@ class ApplicantStatus(str, enum.Enum):
     EXPIRED = "expired"
 
 
+def utc_now():
+    """Database server time as naive UTC, matching the timezone-less DateTime columns"""
+    return func.timezone(literal_column("'utc'"), func.now())
+
+
+def _enum_check(column: str, enum_cls: type[enum.Enum], name: str) -> CheckConstraint:
+    """CHECK constraint limiting a plain string column to an enum's values"""
+    values = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({values})", name=name)
+
+
 class Applicant(Base):
     """Applicant model for storing applicant information"""
     __tablename__ = "applicants"
+    __table_args__ = (
+        _enum_check("status", ApplicantStatus, "ck_applicant_status"),
+    )
     
-    id = Column(String(255), primary_key=True, index=True)  # Sumsub applicant ID
-    external_user_id = Column(String(255), unique=True, index=True, nullable=False)
-    email = Column(String(255), index=True, nullable=False)
-    phone = Column(String(20), nullable=True)
-    first_name = Column(String(255), nullable=False)
-    last_name = Column(String(255), nullable=False)
-    country = Column(String(10), nullable=True)
+    id: Mapped[str] = mapped_column(String(255), primary_key=True, index=True)  # Sumsub applicant ID
+    external_user_id: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(255), index=True)
+    phone: Mapped[Optional[str]] = mapped_column(String(20))
+    first_name: Mapped[str] = mapped_column(String(255))
+    last_name: Mapped[str] = mapped_column(String(255))
+    country: Mapped[Optional[str]] = mapped_column(String(10))
     
     # Status fields
-    status = Column(
-        SQLEnum(ApplicantStatus),
-        default=ApplicantStatus.CREATED,
-        nullable=False,
+    status: Mapped[str] = mapped_column(
+        String(32),
+        default=ApplicantStatus.CREATED.value,
         index=True
     )
-    review_status = Column(String(50), nullable=True)  # Sumsub review status
-    review_result = Column(String(50), nullable=True)  # Sumsub review result
+    review_status: Mapped[Optional[str]] = mapped_column(String(50))  # Sumsub review status
+    review_result: Mapped[Optional[str]] = mapped_column(String(50))  # Sumsub review result
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    sumsub_created_at = Column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now(), index=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now(), onupdate=utc_now())
+    sumsub_created_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
-    verification_steps = relationship("VerificationStep", back_populates="applicant", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="applicant", cascade="all, delete-orphan")
-    webhook_events = relationship("WebhookEvent", back_populates="applicant", cascade="all, delete-orphan")
+    verification_steps: Mapped[list["VerificationStep"]] = relationship(back_populates="applicant", cascade="all, delete-orphan")
+    documents: Mapped[list["Document"]] = relationship(back_populates="applicant", cascade="all, delete-orphan")
+    webhook_events: Mapped[list["WebhookEvent"]] = relationship(back_populates="applicant", cascade="all, delete-orphan")
     
     def __repr__(self):
         return f"<Applicant(id={self.id}, email={self.email}, status={self.status})>"
@@ -74,33 +88,34 @@ class Applicant(Base):
 class VerificationStep(Base):
     """Verification step tracking model"""
     __tablename__ = "verification_steps"
+    __table_args__ = (
+        _enum_check("step", VerificationStepEnum, "ck_verification_step_step"),
+        _enum_check("status", StepStatusEnum, "ck_verification_step_status"),
+        # One row per step per applicant; also serves (applicant_id, step) lookups
+        Index("ix_vstep_applicant_step", "applicant_id", "step", unique=True),
+    )
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    applicant_id = Column(String(255), ForeignKey("applicants.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    applicant_id: Mapped[str] = mapped_column(String(255), ForeignKey("applicants.id"), index=True)
     
-    step = Column(
-        SQLEnum(VerificationStepEnum),
-        nullable=False,
-        index=True
-    )
-    status = Column(
-        SQLEnum(StepStatusEnum),
-        default=StepStatusEnum.PENDING,
-        nullable=False,
+    step: Mapped[str] = mapped_column(String(32))
+    status: Mapped[str] = mapped_column(
+        String(32),
+        default=StepStatusEnum.PENDING.value,
         index=True
     )
     
     # Timestamps
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    error_message = Column(Text, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    error_message: Mapped[Optional[str]] = mapped_column(Text)
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now(), onupdate=utc_now())
     
     # Relationships
-    applicant = relationship("Applicant", back_populates="verification_steps")
+    applicant: Mapped["Applicant"] = relationship(back_populates="verification_steps")
     
     def __repr__(self):
         return f"<VerificationStep(applicant_id={self.applicant_id}, step={self.step}, status={self.status})>"
@@ -110,25 +125,25 @@ class Document(Base):
     """Document storage model"""
     __tablename__ = "documents"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    applicant_id = Column(String(255), ForeignKey("applicants.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    applicant_id: Mapped[str] = mapped_column(String(255), ForeignKey("applicants.id"), index=True)
     
-    document_type = Column(String(50), nullable=False, index=True)  # IDENTITY, SELFIE, etc.
-    file_name = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
-    file_size = Column(Integer, nullable=True)  # Size in bytes
-    mime_type = Column(String(100), nullable=True)  # image/jpeg, etc.
+    document_type: Mapped[str] = mapped_column(String(50), index=True)  # IDENTITY, SELFIE, etc.
+    file_name: Mapped[str] = mapped_column(String(255))
+    file_path: Mapped[str] = mapped_column(String(500))
+    file_size: Mapped[Optional[int]] = mapped_column(Integer)  # Size in bytes
+    mime_type: Mapped[Optional[str]] = mapped_column(String(100))  # image/jpeg, etc.
     
     # Sumsub metadata
-    sumsub_document_id = Column(String(255), nullable=True, index=True)
-    upload_status = Column(String(50), default="pending", nullable=False)
+    sumsub_document_id: Mapped[Optional[str]] = mapped_column(String(255), index=True)
+    upload_status: Mapped[str] = mapped_column(String(50), default="pending")
     
     # Metadata
-    uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    verified_at = Column(DateTime, nullable=True)
+    uploaded_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now(), index=True)
+    verified_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
-    applicant = relationship("Applicant", back_populates="documents")
+    applicant: Mapped["Applicant"] = relationship(back_populates="documents")
     
     def __repr__(self):
         return f"<Document(applicant_id={self.applicant_id}, type={self.document_type})>"
@@ -137,25 +152,28 @@ class Document(Base):
 class WebhookEvent(Base):
     """Webhook event log model"""
     __tablename__ = "webhook_events"
+    __table_args__ = (
+        Index("ix_webhook_applicant_time", "applicant_id", "received_at"),
+    )
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    applicant_id = Column(String(255), ForeignKey("applicants.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    applicant_id: Mapped[str] = mapped_column(String(255), ForeignKey("applicants.id"), index=True)
     
-    event_type = Column(String(100), nullable=False, index=True)
-    applicant_status = Column(String(50), nullable=True)
-    review_status = Column(String(50), nullable=True)
-    review_result = Column(String(50), nullable=True)
+    event_type: Mapped[str] = mapped_column(String(100), index=True)
+    applicant_status: Mapped[Optional[str]] = mapped_column(String(50))
+    review_status: Mapped[Optional[str]] = mapped_column(String(50))
+    review_result: Mapped[Optional[str]] = mapped_column(String(50))
     
     # Raw payload
-    payload = Column(Text, nullable=True)
+    payload: Mapped[Optional[str]] = mapped_column(Text)
     
     # Metadata
-    received_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    processed = Column(Boolean, default=False, nullable=False)
-    processed_at = Column(DateTime, nullable=True)
+    received_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
+    processed: Mapped[bool] = mapped_column(Boolean, default=False)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
-    applicant = relationship("Applicant", back_populates="webhook_events")
+    applicant: Mapped["Applicant"] = relationship(back_populates="webhook_events")
     
     def __repr__(self):
         return f"<WebhookEvent(applicant_id={self.applicant_id}, type={self.event_type})>"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, TypedDict
 from enum import Enum
 
 # ==================== Enums ====================
@@ -39,52 +39,60 @@ class SelfieUploadRequest(BaseModel):
     image_data: Optional[str] = None  # base64 encoded image
 
 # ==================== Step Status Models ====================
-class StepStatusDetail(BaseModel):
+# Response shapes are plain TypedDicts: routes return trusted data, so we skip
+# response_model cloning at startup and re-validation on every response
+class StepStatusDetail(TypedDict):
     step: VerificationStep
     status: StepStatus
-    completed_at: Optional[str] = None
-    error_message: Optional[str] = None
+    completed_at: Optional[str]
+    error_message: Optional[str]
 
-class ApplicantResponse(BaseModel):
+class ApplicantResponse(TypedDict):
     applicant_id: str
     external_user_id: str
     email: str
     status: str
-    steps: list[StepStatusDetail] = []
+    steps: list[StepStatusDetail]
 
 # ==================== Detailed Verification Status ====================
-class FaceLivenessResponse(BaseModel):
+class FaceLivenessResponse(TypedDict):
     applicant_id: str
     status: StepStatus
-    is_alive: Optional[bool] = None
-    confidence: Optional[float] = None
+    is_alive: Optional[bool]
+    confidence: Optional[float]
     message: str
 
-class DocumentVerificationResponse(BaseModel):
+class DocumentVerificationResponse(TypedDict):
     applicant_id: str
     status: StepStatus
     document_type: str
-    verified: Optional[bool] = None
+    verified: Optional[bool]
     message: str
 
-class SelfieVerificationResponse(BaseModel):
+class SelfieVerificationResponse(TypedDict):
     applicant_id: str
     status: StepStatus
-    matches_document: Optional[bool] = None
-    confidence: Optional[float] = None
+    matches_document: Optional[bool]
+    confidence: Optional[float]
     message: str
 
-class VerificationStatusResponse(BaseModel):
+class FullVerificationResponse(TypedDict):
+    applicant_id: str
+    status: StepStatus
+    steps: list[StepStatusDetail]
+    message: str
+
+class VerificationStatusResponse(TypedDict):
     applicant_id: str
     status: str
     review_status: str
     current_step: VerificationStep
     steps_progress: list[StepStatusDetail]
-    document_verification: Optional[str] = None
-    liveness_verification: Optional[str] = None
-    selfie_verification: Optional[str] = None
+    document_verification: Optional[str]
+    liveness_verification: Optional[str]
+    selfie_verification: Optional[str]
     overall_status: str
-    created_at: Optional[str] = None
+    created_at: Optional[str]
 
 class WebhookPayload(BaseModel):
     applicantId: str
@@ -1,37 +1,50 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Depends
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.schemas import (
     CreateApplicantRequest, ApplicantResponse, 
     VerificationStatusResponse, WebhookPayload,
     FaceLivenessResponse, DocumentVerificationResponse, SelfieVerificationResponse,
+    FullVerificationResponse, StepStatusDetail,
     LivenessCheckRequest, DocumentUploadRequest, SelfieUploadRequest,
     VerificationStep, StepStatus
 )
 from services.sumsub_service import sumsub_service
 from database import get_db
 from models.db_models import Applicant, VerificationStepEnum, StepStatusEnum
-from utils.helpers import verify_webhook_signature
+from utils.helpers import verify_webhook_mac
 from config import settings
-import json
+import asyncio
+import hashlib
+import hmac
+import logging
+import orjson
 
 router = APIRouter(prefix="/api/kyc", tags=["KYC"])
+logger = logging.getLogger("kyc")
+
+# Encoded once; webhook signatures are checked against the raw body bytes
+_WEBHOOK_SECRET_BYTES = (settings.SUMSUB_WEBHOOK_SECRET or "").encode()
+
+# Settings are fixed for the process lifetime, so the health body is built once
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "api_base_url": settings.SUMSUB_BASE_URL,
+    "api_key_prefix": settings.SUMSUB_API_KEY[:10] if settings.SUMSUB_API_KEY else None,
+    "is_sandbox": "sandbox" in settings.SUMSUB_BASE_URL,
+    "environment": "Sandbox" if "sandbox" in settings.SUMSUB_BASE_URL else "Production"
+})
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint - shows current configuration"""
-    return {
-        "status": "healthy",
-        "api_base_url": settings.SUMSUB_BASE_URL,
-        "api_key_prefix": settings.SUMSUB_API_KEY[:10] if settings.SUMSUB_API_KEY else None,
-        "is_sandbox": "sandbox" in settings.SUMSUB_BASE_URL,
-        "environment": "Sandbox" if "sandbox" in settings.SUMSUB_BASE_URL else "Production"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
-@router.post("/applicants", response_model=ApplicantResponse)
-async def create_applicant(request: CreateApplicantRequest, db: Session = Depends(get_db)):
+@router.post("/applicants")
+async def create_applicant(request: CreateApplicantRequest, db: AsyncSession = Depends(get_db)):
     """Create new applicant for KYC verification"""
     try:
-        response = sumsub_service.create_applicant(
+        response = await sumsub_service.create_applicant(
             db=db,
             external_user_id=request.external_user_id,
             email=request.email,
@@ -42,7 +55,8 @@ async def create_applicant(request: CreateApplicantRequest, db: Session = Depend
         
         if response.get("id"):
             applicant_id = response["id"]
-            steps = sumsub_service.get_verification_steps(db, applicant_id)
+            # Steps were just initialized as pending - no need to read them back
+            steps = sumsub_service.initial_verification_steps()
             
             return ApplicantResponse(
                 applicant_id=applicant_id,
@@ -57,11 +71,11 @@ async def create_applicant(request: CreateApplicantRequest, db: Session = Depend
         raise HTTPException(status_code=500, detail=str(e))
 
 # ==================== FACE LIVENESS VERIFICATION ====================
-@router.post("/applicants/{applicant_id}/liveness/check", response_model=FaceLivenessResponse)
-async def check_face_liveness(applicant_id: str, db: Session = Depends(get_db)):
+@router.post("/applicants/{applicant_id}/liveness/check")
+async def check_face_liveness(applicant_id: str, db: AsyncSession = Depends(get_db)):
     """Start face liveness detection check"""
     try:
-        result = sumsub_service.check_face_liveness(db, applicant_id)
+        result = await sumsub_service.check_face_liveness(db, applicant_id)
         return FaceLivenessResponse(
             applicant_id=applicant_id,
             status=StepStatus.COMPLETED,
@@ -70,22 +84,24 @@ async def check_face_liveness(applicant_id: str, db: Session = Depends(get_db)):
             message="Liveness check completed successfully"
         )
     except Exception as e:
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.FACE_LIVENESS,
             StepStatusEnum.FAILED, str(e)
         )
         return FaceLivenessResponse(
             applicant_id=applicant_id,
             status=StepStatus.FAILED,
+            is_alive=None,
+            confidence=None,
             message=f"Liveness check failed: {str(e)}"
         )
 
 # ==================== KYC VERIFICATION ====================
-@router.post("/applicants/{applicant_id}/kyc/verify", response_model=DocumentVerificationResponse)
-async def verify_kyc(applicant_id: str, doc_type: str = "IDENTITY", db: Session = Depends(get_db)):
+@router.post("/applicants/{applicant_id}/kyc/verify")
+async def verify_kyc(applicant_id: str, doc_type: str = "IDENTITY", db: AsyncSession = Depends(get_db)):
     """Verify KYC documents"""
     try:
-        result = sumsub_service.verify_kyc_document(db, applicant_id, doc_type)
+        result = await sumsub_service.verify_kyc_document(db, applicant_id, doc_type)
         return DocumentVerificationResponse(
             applicant_id=applicant_id,
             status=StepStatus.COMPLETED,
@@ -98,122 +114,176 @@ async def verify_kyc(applicant_id: str, doc_type: str = "IDENTITY", db: Session
             applicant_id=applicant_id,
             status=StepStatus.FAILED,
             document_type=doc_type,
+            verified=None,
             message=f"KYC verification failed: {str(e)}"
         )
 
 # ==================== DOCUMENT UPLOAD ====================
-@router.post("/applicants/{applicant_id}/documents/id", response_model=DocumentVerificationResponse)
+@router.post("/applicants/{applicant_id}/documents/id")
 async def upload_id_document(applicant_id: str, file: UploadFile = File(...), 
-                            country: str = "IT", db: Session = Depends(get_db)):
+                            country: str = "IT", db: AsyncSession = Depends(get_db)):
     """Upload ID document for verification"""
     try:
-        import tempfile
-        import os
-        
         # Update step status
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.ID_SCAN, StepStatusEnum.IN_PROGRESS
         )
         
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # Stream the upload's own spooled file straight to Sumsub (no temp copy)
+        await file.seek(0)
+        response = await sumsub_service.upload_id_document(
+            applicant_id=applicant_id,
+            file_obj=file.file,
+            file_name=file.filename or "document.jpg",
+            doc_type="IDENTITY",
+            country=country
+        )
         
-        try:
-            response = sumsub_service.upload_id_document(
-                applicant_id=applicant_id,
-                file_path=tmp_path,
-                doc_type="IDENTITY",
-                country=country
-            )
-            
-            # Mark step as completed
-            sumsub_service.update_step_status(
-                db, applicant_id, VerificationStepEnum.ID_SCAN, StepStatusEnum.COMPLETED
-            )
-            
-            return DocumentVerificationResponse(
-                applicant_id=applicant_id,
-                status=StepStatus.COMPLETED,
-                document_type="IDENTITY",
-                verified=True,
-                message="ID document uploaded successfully"
-            )
-        finally:
-            os.unlink(tmp_path)
+        # Mark step as completed
+        await sumsub_service.update_step_status(
+            db, applicant_id, VerificationStepEnum.ID_SCAN, StepStatusEnum.COMPLETED
+        )
+        
+        return DocumentVerificationResponse(
+            applicant_id=applicant_id,
+            status=StepStatus.COMPLETED,
+            document_type="IDENTITY",
+            verified=True,
+            message="ID document uploaded successfully"
+        )
     except Exception as e:
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.ID_SCAN, 
             StepStatusEnum.FAILED, str(e)
         )
         raise HTTPException(status_code=500, detail=str(e))
 
 # ==================== SELFIE UPLOAD ====================
-@router.post("/applicants/{applicant_id}/documents/selfie", response_model=SelfieVerificationResponse)
-async def upload_selfie(applicant_id: str, file: UploadFile = File(...), db: Session = Depends(get_db)):
+@router.post("/applicants/{applicant_id}/documents/selfie")
+async def upload_selfie(applicant_id: str, file: UploadFile = File(...), db: AsyncSession = Depends(get_db)):
     """Upload selfie for liveness and face matching verification"""
     try:
-        import tempfile
-        import os
-        
         # Update step status
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.SELFIE, StepStatusEnum.IN_PROGRESS
         )
         
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # Stream the upload's own spooled file straight to Sumsub (no temp copy)
+        await file.seek(0)
+        response = await sumsub_service.upload_selfie(
+            applicant_id=applicant_id,
+            file_obj=file.file,
+            file_name=file.filename or "selfie.jpg"
+        )
         
-        try:
-            response = sumsub_service.upload_selfie(
-                applicant_id=applicant_id,
-                file_path=tmp_path
-            )
-            
-            # Mark step as completed
-            sumsub_service.update_step_status(
-                db, applicant_id, VerificationStepEnum.SELFIE, StepStatusEnum.COMPLETED
-            )
-            
-            return SelfieVerificationResponse(
-                applicant_id=applicant_id,
-                status=StepStatus.COMPLETED,
-                matches_document=True,
-                confidence=0.95,
-                message="Selfie uploaded and verified successfully"
-            )
-        finally:
-            os.unlink(tmp_path)
+        # Mark step as completed
+        await sumsub_service.update_step_status(
+            db, applicant_id, VerificationStepEnum.SELFIE, StepStatusEnum.COMPLETED
+        )
+        
+        return SelfieVerificationResponse(
+            applicant_id=applicant_id,
+            status=StepStatus.COMPLETED,
+            matches_document=True,
+            confidence=0.95,
+            message="Selfie uploaded and verified successfully"
+        )
     except Exception as e:
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.SELFIE,
             StepStatusEnum.FAILED, str(e)
         )
         raise HTTPException(status_code=500, detail=str(e))
 
+# ==================== FULL VERIFICATION ====================
+@router.post("/applicants/{applicant_id}/verify")
+async def verify_applicant(applicant_id: str, id_file: UploadFile = File(...),
+                           selfie_file: UploadFile = File(...), country: str = "IT",
+                           db: AsyncSession = Depends(get_db)):
+    """Submit face liveness, ID document and selfie in one request"""
+    submitted = (VerificationStepEnum.FACE_LIVENESS, VerificationStepEnum.ID_SCAN, VerificationStepEnum.SELFIE)
+    # Steps marked in progress and not yet given an outcome
+    unresolved = []
+    try:
+        for step in submitted:
+            await sumsub_service.update_step_status(db, applicant_id, step, StepStatusEnum.IN_PROGRESS)
+            unresolved.append(step)
+        
+        # Sumsub calls run concurrently; the session is only used again once they're done
+        await id_file.seek(0)
+        await selfie_file.seek(0)
+        results = await sumsub_service.verify_applicant(
+            applicant_id=applicant_id,
+            id_file=id_file.file,
+            id_file_name=id_file.filename or "document.jpg",
+            selfie_file=selfie_file.file,
+            selfie_file_name=selfie_file.filename or "selfie.jpg",
+            country=country
+        )
+        
+        steps = []
+        for step, result in zip(submitted, (results["liveness"], results["id_document"], results["selfie"])):
+            if isinstance(result, BaseException):
+                await sumsub_service.update_step_status(
+                    db, applicant_id, step, StepStatusEnum.FAILED, str(result)
+                )
+                unresolved.remove(step)
+                steps.append(StepStatusDetail(
+                    step=VerificationStep(step.value),
+                    status=StepStatus.FAILED,
+                    completed_at=None,
+                    error_message=str(result)
+                ))
+            else:
+                updated = await sumsub_service.update_step_status(
+                    db, applicant_id, step, StepStatusEnum.COMPLETED
+                )
+                unresolved.remove(step)
+                steps.append(StepStatusDetail(
+                    step=VerificationStep(step.value),
+                    status=StepStatus.COMPLETED,
+                    completed_at=updated["updated_at"],
+                    error_message=None
+                ))
+        
+        failed = [s["step"].value for s in steps if s["status"] == StepStatus.FAILED]
+        return FullVerificationResponse(
+            applicant_id=applicant_id,
+            status=StepStatus.FAILED if failed else StepStatus.COMPLETED,
+            steps=steps,
+            message=f"Verification failed for: {', '.join(failed)}" if failed
+                    else "Liveness, ID document and selfie submitted successfully"
+        )
+    except Exception as e:
+        # Don't leave steps stuck in progress; discard any half-done transaction first
+        await db.rollback()
+        for step in unresolved:
+            try:
+                await sumsub_service.update_step_status(
+                    db, applicant_id, step, StepStatusEnum.FAILED, str(e)
+                )
+            except Exception:
+                logger.exception("step_reset_failed", extra={"applicant_id": applicant_id, "step": step.value})
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ==================== VERIFICATION STATUS ====================
-@router.get("/applicants/{applicant_id}/status", response_model=VerificationStatusResponse)
-async def get_verification_status(applicant_id: str, db: Session = Depends(get_db)):
+@router.get("/applicants/{applicant_id}/status")
+async def get_verification_status(applicant_id: str, db: AsyncSession = Depends(get_db)):
     """Get detailed verification status of applicant"""
     try:
-        response = sumsub_service.get_applicant_status(applicant_id)
-        steps = sumsub_service.get_verification_steps(db, applicant_id)
-        
-        # Determine current step
-        current_step = VerificationStep.VERIFICATION_COMPLETE
-        overall_status = "approved"
-        for step in steps:
-            if step.status == StepStatus.PENDING:
-                current_step = step.step
-                overall_status = "pending"
-                break
-            elif step.status == StepStatus.FAILED:
-                overall_status = "failed"
+        # Sumsub call and DB read are independent - overlap them
+        status_task = asyncio.ensure_future(sumsub_service.get_applicant_status(applicant_id))
+        steps_task = asyncio.ensure_future(sumsub_service.get_verification_steps(db, applicant_id))
+        try:
+            response, steps = await asyncio.gather(status_task, steps_task)
+        except BaseException:
+            # gather doesn't stop the sibling - cancel and wait for it so the
+            # session is idle before get_db closes it
+            status_task.cancel()
+            steps_task.cancel()
+            await asyncio.gather(status_task, steps_task, return_exceptions=True)
+            raise
+        current_step, overall_status = sumsub_service.get_current_step(steps)
         
         return VerificationStatusResponse(
             applicant_id=applicant_id,
@@ -223,6 +293,7 @@ async def get_verification_status(applicant_id: str, db: Session = Depends(get_d
             steps_progress=steps,
             document_verification=response.get("reviewResult"),
             liveness_verification=response.get("reviewResult"),
+            selfie_verification=None,
             overall_status=overall_status,
             created_at=response.get("createdAt")
         )
@@ -230,16 +301,16 @@ async def get_verification_status(applicant_id: str, db: Session = Depends(get_d
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/applicants/{applicant_id}/steps")
-async def get_verification_steps(applicant_id: str, db: Session = Depends(get_db)):
+async def get_verification_steps(applicant_id: str, db: AsyncSession = Depends(get_db)):
     """Get all verification steps for an applicant"""
     try:
-        steps = sumsub_service.get_verification_steps(db, applicant_id)
+        steps = await sumsub_service.get_verification_steps(db, applicant_id)
         return {
             "applicant_id": applicant_id,
             "steps": steps,
             "total_steps": len(steps),
-            "completed_steps": len([s for s in steps if s.status == StepStatus.COMPLETED]),
-            "failed_steps": len([s for s in steps if s.status == StepStatus.FAILED])
+            "completed_steps": len([s for s in steps if s["status"] == StepStatus.COMPLETED]),
+            "failed_steps": len([s for s in steps if s["status"] == StepStatus.FAILED])
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -249,7 +320,7 @@ async def get_sdk_token(applicant_id: str, external_user_id: str,
                        email: str = "", phone: str = ""):
     """Generate SDK access token for Web/Mobile SDKs"""
     try:
-        token_response = sumsub_service.create_sdk_token(
+        token_response = await sumsub_service.create_sdk_token(
             external_user_id=external_user_id,
             email=email,
             phone=phone,
@@ -264,15 +335,15 @@ async def get_sdk_token(applicant_id: str, external_user_id: str,
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/applicants/{applicant_id}/status/pending")
-async def set_applicant_pending(applicant_id: str, db: Session = Depends(get_db)):
+async def set_applicant_pending(applicant_id: str, db: AsyncSession = Depends(get_db)):
     """Submit applicant for final review"""
     try:
         # Mark verification as complete
-        sumsub_service.update_step_status(
+        await sumsub_service.update_step_status(
             db, applicant_id, VerificationStepEnum.VERIFICATION_COMPLETE, StepStatusEnum.COMPLETED
         )
         
-        response = sumsub_service.set_applicant_pending(applicant_id)
+        response = await sumsub_service.set_applicant_pending(applicant_id)
         return {
             "applicant_id": applicant_id,
             "status": "submitted_for_review",
@@ -283,30 +354,40 @@ async def set_applicant_pending(applicant_id: str, db: Session = Depends(get_db)
 
 # ==================== WEBHOOKS ====================
 @router.post("/webhooks/verification")
-async def verification_webhook(request: Request):
+async def verification_webhook(request: Request, db: AsyncSession = Depends(get_db)):
     """Webhook for Sumsub verification updates"""
     try:
-        body = await request.body()
         signature = request.headers.get("X-Webhook-Signature", "")
         
+        # Hash the body while it streams in instead of buffering it first
+        mac = hmac.new(_WEBHOOK_SECRET_BYTES, digestmod=hashlib.sha256)
+        body = bytearray()
+        async for chunk in request.stream():
+            mac.update(chunk)
+            body.extend(chunk)
+        
         # Verify signature
-        if not verify_webhook_signature(body.decode(), signature, settings.SUMSUB_WEBHOOK_SECRET):
+        if not _WEBHOOK_SECRET_BYTES or not verify_webhook_mac(mac, signature):
             raise HTTPException(status_code=401, detail="Invalid signature")
         
-        payload = json.loads(body)
+        payload = orjson.loads(body)
         
         # Process webhook payload
         applicant_id = payload.get("applicantId")
         status = payload.get("applicantStatus")
         review_status = payload.get("reviewStatus")
+        sumsub_service.invalidate_applicant(applicant_id)
         
         # Update verification completion status
         if review_status == "completed":
-            sumsub_service.update_step_status(
-                applicant_id, VerificationStep.VERIFICATION_COMPLETE, StepStatus.COMPLETED
+            await sumsub_service.update_step_status(
+                db, applicant_id, VerificationStepEnum.VERIFICATION_COMPLETE, StepStatusEnum.COMPLETED
             )
         
-        print(f"Webhook received - Applicant: {applicant_id}, Status: {status}, Review: {review_status}")
+        logger.info(
+            "webhook",
+            extra={"applicant_id": applicant_id, "status": status, "review_status": review_status}
+        )
         
         return {"status": "received", "applicant_id": applicant_id}
     except Exception as e:
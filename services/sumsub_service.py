@@ -1,26 +1,147 @@
-import requests
-import json
+import asyncio
+import httpx
+import orjson
 import time
-from typing import Dict, Any, Optional
-from datetime import datetime
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from typing import Dict, Any, Optional, BinaryIO
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from config import settings
-from utils.helpers import prepare_headers, generate_signature
+from utils.helpers import generate_signature, file_sha256
 from utils.exceptions import SumsubAPIError, DocumentUploadError, ApplicantNotFoundError
 from models.schemas import VerificationStep, StepStatus, StepStatusDetail
 from models.db_models import (
     Applicant, VerificationStep as VerificationStepDB, Document, ApplicantStatus,
-    VerificationStepEnum, StepStatusEnum
+    VerificationStepEnum, StepStatusEnum, utc_now
 )
 
+# Steps every new applicant starts with, in order
+VERIFICATION_STEPS = (
+    VerificationStepEnum.FACE_LIVENESS,
+    VerificationStepEnum.KYC_VERIFICATION,
+    VerificationStepEnum.ID_SCAN,
+    VerificationStepEnum.SELFIE,
+    VerificationStepEnum.VERIFICATION_COMPLETE
+)
+
+# Transient Sumsub responses retried with exponential backoff (0.2s, 0.4s, 0.8s)
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# A 429 means the request was not processed, so even non-idempotent calls may resend it;
+# after a gateway 5xx Sumsub may already have applied the request
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2
+
+# Applicant reads are cached briefly so status pollers don't each hit Sumsub
+APPLICANT_CACHE_TTL = 10  # seconds
+APPLICANT_CACHE_SIZE = 4096
+
+# Upper bound for the startup warm-up request, including transport connect retries
+WARM_UP_TIMEOUT = 2.0
+
+class _UploadStream:
+    """
+    Read/seek-only view of an upload file for httpx multipart bodies.
+    
+    httpx sizes file parts via fileno() when available, which makes a
+    SpooledTemporaryFile roll over to disk. Without fileno() it sizes the part
+    with seek/tell and still streams it in chunks.
+    """
+    def __init__(self, file_obj: BinaryIO):
+        self._file = file_obj
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+
 class SumsubService:
     def __init__(self):
         self.base_url = settings.SUMSUB_BASE_URL
         self.api_key = settings.SUMSUB_API_KEY
-        self.api_secret = settings.SUMSUB_API_SECRET
+        # Encoded once - every request signature is an HMAC keyed with it
+        self._secret_bytes = (settings.SUMSUB_API_SECRET or "").encode()
         self.level_name = settings.SUMSUB_LEVEL_NAME
+        
+        # Static header templates; only the timestamp and signature change per request
+        self._base_headers = {"X-App-Token": self.api_key}
+        self._json_headers = {**self._base_headers, "Content-Type": "application/json"}
+        
+        # One pooled client per process: keeps TCP + TLS connections to Sumsub alive.
+        # With HTTP/2, concurrent calls (e.g. verify_applicant's gather) are multiplexed
+        # over one connection, so the pool rarely needs more than a few sockets.
+        # The transport also retries failed connection attempts.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Accept": "application/json"},
+            # Short connect timeout so an unreachable Sumsub fails fast
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=MAX_RETRIES,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        )
+        
+        # applicant_id -> (fetched_at, applicant data); only touched from the event loop
+        self._applicant_cache = TTLCache(maxsize=APPLICANT_CACHE_SIZE, ttl=APPLICANT_CACHE_TTL)
+        # applicant_id -> running fetch shared by concurrent cache misses
+        self._inflight: dict[str, asyncio.Task] = {}
     
-    def create_applicant(self, db: Session, external_user_id: str, email: str = "", 
+    async def warm_up(self) -> bool:
+        """
+        Open a pooled connection to Sumsub (DNS + TCP + TLS) ahead of the first real request
+        
+        Any response counts as success; returns False if the connection could not be made.
+        """
+        try:
+            await asyncio.wait_for(self._client.head("/"), WARM_UP_TIMEOUT)
+        except (httpx.HTTPError, asyncio.TimeoutError):
+            return False
+        return True
+    
+    async def aclose(self):
+        """Close pooled Sumsub connections (call on app shutdown)"""
+        await self._client.aclose()
+    
+    async def _request(self, method: str, path: str, idempotent: Optional[bool] = None,
+                       **kwargs) -> httpx.Response:
+        """
+        Send a request to Sumsub, retrying transient responses
+        
+        Idempotent requests (GET/HEAD by default) are retried on 429 and gateway 5xx,
+        others only on 429. Pass idempotent=True for a POST that is safe to resend.
+        """
+        if idempotent is None:
+            idempotent = method in ("GET", "HEAD")
+        retry_statuses = RETRY_STATUSES if idempotent else NON_IDEMPOTENT_RETRY_STATUSES
+        for attempt in range(MAX_RETRIES + 1):
+            response = await self._client.request(method, path, **kwargs)
+            if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+                return response
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    def _headers_for(self, method: str, path: str, body: bytes = b"", multipart: bool = False) -> Dict[str, str]:
+        """
+        Signed Sumsub headers for one request
+        Signature format: METHOD + path + body + timestamp
+        
+        Multipart requests are signed with an empty body and get no Content-Type,
+        so httpx can set it with the boundary.
+        """
+        headers = (self._base_headers if multipart else self._json_headers).copy()
+        timestamp = int(time.time())
+        headers["X-App-Access-Ts"] = str(timestamp)
+        headers["X-App-Access-Sig"] = generate_signature(method, path, body, timestamp, self._secret_bytes)
+        return headers
+    
+    async def create_applicant(self, db: AsyncSession, external_user_id: str, email: str = "", 
                         first_name: str = "", last_name: str = "", country: str = "") -> Dict[str, Any]:
         """
         Create a new applicant via official API flow
@@ -47,14 +168,10 @@ class SumsubService:
                 "email": email or ""
             }
         
-        body = json.dumps(payload)
-        headers = prepare_headers(method, path, body, self.api_key, self.api_secret)
+        body = orjson.dumps(payload)
+        headers = self._headers_for(method, path, body)
         
-        response = requests.post(
-            f"{self.base_url}{path}",
-            headers=headers,
-            data=body
-        )
+        response = await self._request("POST", path, headers=headers, content=body)
         
         if response.status_code not in [200, 201]:
             raise SumsubAPIError(
@@ -74,32 +191,68 @@ class SumsubService:
             first_name=first_name,
             last_name=last_name,
             country=country,
-            status=ApplicantStatus.CREATED,
-            sumsub_created_at=datetime.utcnow()
+            status=ApplicantStatus.CREATED.value,
+            sumsub_created_at=utc_now()
         )
         db.add(db_applicant)
-        db.commit()
-        db.refresh(db_applicant)
+        await db.flush()
         
-        # Initialize verification steps
-        self.initialize_verification_steps(db, applicant_id)
+        # Initialize verification steps - same transaction as the applicant row.
+        # All column values are known here, so the row is not read back.
+        await self.initialize_verification_steps(db, applicant_id)
+        await db.commit()
         
         return api_response
     
-    def get_applicant(self, applicant_id: str) -> Dict[str, Any]:
+    async def get_applicant(self, applicant_id: str, ttl_ms: Optional[int] = None) -> Dict[str, Any]:
         """
-        Get applicant full data via official API
+        Get applicant full data via official API, cached per applicant
         GET /resources/applicants/{applicantId}
+        
+        Args:
+            applicant_id: Applicant ID
+            ttl_ms: Max age of a cached response to accept (default APPLICANT_CACHE_TTL,
+                    0 forces a fresh read)
         """
+        max_age = APPLICANT_CACHE_TTL if ttl_ms is None else ttl_ms / 1000
+        cached = self._applicant_cache.get(applicant_id)
+        if cached and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        
+        # Single-flight: concurrent misses for one applicant share a single Sumsub request.
+        # Shielded so a cancelled caller does not cancel the fetch for the others.
+        task = self._inflight.get(applicant_id)
+        if task is None:
+            task = asyncio.create_task(self._load_applicant(applicant_id))
+            self._inflight[applicant_id] = task
+        return await asyncio.shield(task)
+    
+    async def _load_applicant(self, applicant_id: str) -> Dict[str, Any]:
+        """Fetch an applicant and fill the cache, unless it was invalidated meanwhile"""
+        task = asyncio.current_task()
+        try:
+            applicant = await self._fetch_applicant(applicant_id)
+            if self._inflight.get(applicant_id) is task:
+                self._applicant_cache[applicant_id] = (time.monotonic(), applicant)
+            return applicant
+        finally:
+            if self._inflight.get(applicant_id) is task:
+                del self._inflight[applicant_id]
+    
+    def invalidate_applicant(self, applicant_id: str) -> None:
+        """Drop the cached applicant data (call when its status changes)"""
+        self._applicant_cache.pop(applicant_id, None)
+        # A fetch already in flight may have read the old status - later callers start a new one
+        self._inflight.pop(applicant_id, None)
+    
+    async def _fetch_applicant(self, applicant_id: str) -> Dict[str, Any]:
+        """GET /resources/applicants/{applicantId} without caching"""
         method = "GET"
         path = f"/resources/applicants/{applicant_id}"
         
-        headers = prepare_headers(method, path, "", self.api_key, self.api_secret)
+        headers = self._headers_for(method, path)
         
-        response = requests.get(
-            f"{self.base_url}{path}",
-            headers=headers
-        )
+        response = await self._request("GET", path, headers=headers)
         
         if response.status_code == 404:
             raise ApplicantNotFoundError(applicant_id)
@@ -113,12 +266,12 @@ class SumsubService:
         
         return response.json()
     
-    def get_applicant_status(self, applicant_id: str) -> Dict[str, Any]:
+    async def get_applicant_status(self, applicant_id: str, ttl_ms: Optional[int] = None) -> Dict[str, Any]:
         """
         Get applicant review status
         Wrapper around get_applicant() to extract status fields
         """
-        applicant = self.get_applicant(applicant_id)
+        applicant = await self.get_applicant(applicant_id, ttl_ms=ttl_ms)
         
         return {
             "applicantId": applicant.get("id"),
@@ -128,145 +281,174 @@ class SumsubService:
             "createdAt": applicant.get("createdAt")
         }
     
-    def initialize_verification_steps(self, db: Session, applicant_id: str) -> Dict[str, Any]:
-        """Initialize verification steps tracking for an applicant in database"""
-        steps = [
-            VerificationStepEnum.FACE_LIVENESS,
-            VerificationStepEnum.KYC_VERIFICATION,
-            VerificationStepEnum.ID_SCAN,
-            VerificationStepEnum.SELFIE,
-            VerificationStepEnum.VERIFICATION_COMPLETE
-        ]
+    async def initialize_verification_steps(self, db: AsyncSession, applicant_id: str) -> Dict[str, Any]:
+        """
+        Initialize verification steps tracking for an applicant in database
         
-        for step in steps:
-            db_step = VerificationStepDB(
-                applicant_id=applicant_id,
-                step=step,
-                status=StepStatusEnum.PENDING
+        Inserts all steps with one multi-row INSERT; the caller commits.
+        Steps that already exist are left untouched, so re-seeding is a no-op.
+        """
+        rows = [
+            {"applicant_id": applicant_id, "step": step.value, "status": StepStatusEnum.PENDING.value}
+            for step in VERIFICATION_STEPS
+        ]
+        await db.execute(
+            insert(VerificationStepDB).on_conflict_do_nothing(index_elements=["applicant_id", "step"]),
+            rows
+        )
+        return {"applicant_id": applicant_id, "steps_initialized": len(VERIFICATION_STEPS)}
+    
+    def initial_verification_steps(self) -> list:
+        """Step details of a just-created applicant (all pending), without reading them back"""
+        return [
+            StepStatusDetail(
+                step=VerificationStep(step.value),
+                status=StepStatus.PENDING,
+                completed_at=None,
+                error_message=None
             )
-            db.add(db_step)
-        
-        db.commit()
-        return {"applicant_id": applicant_id, "steps_initialized": len(steps)}
+            for step in VERIFICATION_STEPS
+        ]
     
-    def update_step_status(self, db: Session, applicant_id: str, step: VerificationStepEnum, 
+    async def update_step_status(self, db: AsyncSession, applicant_id: str, step: VerificationStepEnum, 
                           status: StepStatusEnum, error_message: str = None) -> Dict[str, Any]:
-        """Update the status of a verification step in database"""
-        db_step = db.query(VerificationStepDB).filter(
-            VerificationStepDB.applicant_id == applicant_id,
-            VerificationStepDB.step == step
-        ).first()
-        
-        if not db_step:
-            raise ValueError(f"Step {step} not found for applicant {applicant_id}")
+        """Update the status of a verification step in database
         
-        db_step.status = status
-        db_step.error_message = error_message
+        Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE + refresh.
+        Timestamps come from the database clock (updated_at via the column's onupdate).
+        """
+        changes = {"status": status.value, "error_message": error_message}
         
         if status == StepStatusEnum.IN_PROGRESS:
-            db_step.started_at = datetime.utcnow()
+            changes["started_at"] = utc_now()
         elif status == StepStatusEnum.COMPLETED:
-            db_step.completed_at = datetime.utcnow()
+            changes["completed_at"] = utc_now()
+        
+        stmt = (
+            update(VerificationStepDB)
+            .where(
+                VerificationStepDB.applicant_id == applicant_id,
+                VerificationStepDB.step == step.value
+            )
+            .values(**changes)
+            .returning(VerificationStepDB.updated_at)
+        )
+        result = await db.execute(stmt)
+        updated_at = result.scalar_one_or_none()
+        
+        if updated_at is None:
+            await db.rollback()
+            raise ValueError(f"Step {step} not found for applicant {applicant_id}")
         
-        db_step.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(db_step)
+        await db.commit()
         
-        return {"step": step, "status": status, "updated_at": db_step.updated_at.isoformat()}
+        return {"step": step, "status": status, "updated_at": updated_at.isoformat()}
     
-    def get_verification_steps(self, db: Session, applicant_id: str) -> list:
+    async def get_verification_steps(self, db: AsyncSession, applicant_id: str) -> list:
         """Get all verification steps for an applicant from database"""
-        db_steps = db.query(VerificationStepDB).filter(
-            VerificationStepDB.applicant_id == applicant_id
-        ).all()
+        # Columns only - any relationship access raises instead of lazy loading per row
+        result = await db.execute(
+            select(VerificationStepDB).options(raiseload("*")).where(
+                VerificationStepDB.applicant_id == applicant_id
+            ).order_by(VerificationStepDB.id)
+        )
+        db_steps = result.scalars().all()
         
         return [
             StepStatusDetail(
-                step=VerificationStep(step.step.value),
-                status=StepStatus(step.status.value),
+                step=VerificationStep(step.step),
+                status=StepStatus(step.status),
                 completed_at=step.completed_at.isoformat() if step.completed_at else None,
                 error_message=step.error_message
             )
             for step in db_steps
         ]
     
-    def check_face_liveness(self, db: Session, applicant_id: str, video_data: Optional[bytes] = None) -> Dict[str, Any]:
+    def get_current_step(self, steps: list) -> tuple[VerificationStep, str]:
+        """
+        Current step and overall status from ordered step details
+        (as returned by get_verification_steps) - first pending step wins
+        """
+        overall_status = "approved"
+        for step in steps:
+            if step["status"] == StepStatus.PENDING:
+                return step["step"], "pending"
+            if step["status"] == StepStatus.FAILED:
+                overall_status = "failed"
+        return VerificationStep.VERIFICATION_COMPLETE, overall_status
+    
+    async def submit_face_liveness(self, applicant_id: str, video_data: Optional[bytes] = None) -> Dict[str, Any]:
         """
-        Check face liveness for applicant
+        Submit face liveness check to Sumsub (no step bookkeeping)
         POST /resources/applicants/{applicantId}/info/faceLiveness
         
+        Returns:
+            Dict with is_alive, confidence, and status
+        """
+        method = "POST"
+        path = f"/resources/applicants/{applicant_id}/info/faceLiveness"
+        
+        headers = self._headers_for(method, path, multipart=True)
+        
+        # If video data provided, send as file, otherwise make empty POST
+        if video_data:
+            files = {'content': ('liveness.mp4', video_data, 'video/mp4')}
+            response = await self._request("POST", path, headers=headers, files=files)
+        else:
+            response = await self._request("POST", path, headers=headers)
+        # The applicant's state in Sumsub has changed - drop the cached read
+        self.invalidate_applicant(applicant_id)
+        
+        if response.status_code not in [200, 201]:
+            raise SumsubAPIError(
+                message=f"Face liveness check failed: {response.status_code}",
+                status_code=response.status_code,
+                details={"response": response.text}
+            )
+        
+        result = response.json()
+        
+        return {
+            "applicant_id": applicant_id,
+            "is_alive": result.get("isAlive", False),
+            "confidence": result.get("confidence", 0),
+            "status": "completed"
+        }
+    
+    async def check_face_liveness(self, db: AsyncSession, applicant_id: str, video_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Check face liveness for applicant and track the FACE_LIVENESS step
+        
         Returns:
             Dict with is_alive, confidence, and status
         """
         try:
             # Update step to in-progress
-            self.update_step_status(db, applicant_id, VerificationStepEnum.FACE_LIVENESS, StepStatusEnum.IN_PROGRESS)
-            
-            method = "POST"
-            path = f"/resources/applicants/{applicant_id}/info/faceLiveness"
-            
-            timestamp = int(time.time())
-            signature = generate_signature(method, path, "", timestamp, self.api_secret)
-            
-            headers = {
-                "X-App-Token": self.api_key,
-                "X-App-Access-Ts": str(timestamp),
-                "X-App-Access-Sig": signature
-            }
-            
-            # If video data provided, send as file, otherwise make empty POST
-            if video_data:
-                files = {'content': ('liveness.mp4', video_data, 'video/mp4')}
-                response = requests.post(
-                    f"{self.base_url}{path}",
-                    headers=headers,
-                    files=files
-                )
-            else:
-                response = requests.post(
-                    f"{self.base_url}{path}",
-                    headers=headers
-                )
-            
-            if response.status_code not in [200, 201]:
-                self.update_step_status(
-                    db, applicant_id, VerificationStepEnum.FACE_LIVENESS, 
-                    StepStatusEnum.FAILED, f"API Error: {response.status_code}"
-                )
-                raise SumsubAPIError(
-                    message=f"Face liveness check failed: {response.status_code}",
-                    status_code=response.status_code,
-                    details={"response": response.text}
-                )
+            await self.update_step_status(db, applicant_id, VerificationStepEnum.FACE_LIVENESS, StepStatusEnum.IN_PROGRESS)
             
-            result = response.json()
+            result = await self.submit_face_liveness(applicant_id, video_data)
             
             # Mark step as completed
-            self.update_step_status(db, applicant_id, VerificationStepEnum.FACE_LIVENESS, StepStatusEnum.COMPLETED)
+            await self.update_step_status(db, applicant_id, VerificationStepEnum.FACE_LIVENESS, StepStatusEnum.COMPLETED)
             
-            return {
-                "applicant_id": applicant_id,
-                "is_alive": result.get("isAlive", False),
-                "confidence": result.get("confidence", 0),
-                "status": "completed"
-            }
+            return result
         except Exception as e:
-            self.update_step_status(
+            await self.update_step_status(
                 db, applicant_id, VerificationStepEnum.FACE_LIVENESS, 
                 StepStatusEnum.FAILED, str(e)
             )
             raise
     
-    def verify_kyc_document(self, db: Session, applicant_id: str, doc_type: str = "IDENTITY") -> Dict[str, Any]:
+    async def verify_kyc_document(self, db: AsyncSession, applicant_id: str, doc_type: str = "IDENTITY") -> Dict[str, Any]:
         """
         Mark KYC verification step as completed
         """
         try:
-            self.update_step_status(db, applicant_id, VerificationStepEnum.KYC_VERIFICATION, StepStatusEnum.IN_PROGRESS)
+            await self.update_step_status(db, applicant_id, VerificationStepEnum.KYC_VERIFICATION, StepStatusEnum.IN_PROGRESS)
             
             # Simulate KYC verification - in production, call actual API
             # For now, mark as completed
-            self.update_step_status(db, applicant_id, VerificationStepEnum.KYC_VERIFICATION, StepStatusEnum.COMPLETED)
+            await self.update_step_status(db, applicant_id, VerificationStepEnum.KYC_VERIFICATION, StepStatusEnum.COMPLETED)
             
             return {
                 "applicant_id": applicant_id,
@@ -274,13 +456,13 @@ class SumsubService:
                 "status": "verified"
             }
         except Exception as e:
-            self.update_step_status(
+            await self.update_step_status(
                 db, applicant_id, VerificationStepEnum.KYC_VERIFICATION, 
                 StepStatusEnum.FAILED, str(e)
             )
             raise
     
-    def upload_id_document(self, applicant_id: str, file_path: str, 
+    async def upload_id_document(self, applicant_id: str, file_obj: BinaryIO, file_name: str,
                           doc_type: str = "IDENTITY", country: str = "IT") -> Dict[str, Any]:
         """
         Upload ID document via official API
@@ -288,38 +470,34 @@ class SumsubService:
         
         Args:
             applicant_id: Applicant ID
-            file_path: Path to document file
+            file_obj: Binary file-like object with the document (streamed as-is)
+            file_name: File name sent to Sumsub
             doc_type: Document type (IDENTITY, SELFIE, etc.)
             country: Country code
         """
         method = "POST"
         path = f"/resources/applicants/{applicant_id}/info/idDoc"
         
-        timestamp = int(time.time())
-        # For file uploads, body is empty in signature
-        signature = generate_signature(method, path, "", timestamp, self.api_secret)
+        # Same key on every retry of this upload so Sumsub can drop duplicates;
+        # hashed off the event loop since the file may be several MB
+        digest = await asyncio.to_thread(file_sha256, file_obj)
         
-        headers = {
-            "X-App-Token": self.api_key,
-            "X-App-Access-Ts": str(timestamp),
-            "X-App-Access-Sig": signature
-        }
+        # For file uploads, body is empty in signature
+        headers = self._headers_for(method, path, multipart=True)
+        headers["X-Idempotency-Key"] = f"{applicant_id}-{doc_type}-{digest}"
         
         metadata = {
             "idDocType": doc_type,
             "country": country
         }
         
-        with open(file_path, 'rb') as f:
-            files = {
-                'metadata': (None, json.dumps(metadata), 'application/json'),
-                'content': (f.name, f, 'image/jpeg')
-            }
-            response = requests.post(
-                f"{self.base_url}{path}",
-                headers=headers,
-                files=files
-            )
+        files = {
+            'metadata': (None, orjson.dumps(metadata), 'application/json'),
+            'content': (file_name, _UploadStream(file_obj), 'image/jpeg')
+        }
+        # Not retried on gateway 5xx - Sumsub may already have stored the document
+        response = await self._request("POST", path, headers=headers, files=files)
+        self.invalidate_applicant(applicant_id)
         
         if response.status_code not in [200, 201]:
             raise DocumentUploadError(
@@ -329,14 +507,36 @@ class SumsubService:
         
         return response.json()
     
-    def upload_selfie(self, applicant_id: str, file_path: str) -> Dict[str, Any]:
+    async def upload_selfie(self, applicant_id: str, file_obj: BinaryIO, file_name: str) -> Dict[str, Any]:
         """
         Upload selfie/face photo via official API
         POST /resources/applicants/{applicantId}/info/idDoc
         """
-        return self.upload_id_document(applicant_id, file_path, "SELFIE")
+        return await self.upload_id_document(applicant_id, file_obj, file_name, "SELFIE")
     
-    def set_applicant_pending(self, applicant_id: str) -> Dict[str, Any]:
+    async def verify_applicant(self, applicant_id: str, id_file: BinaryIO, id_file_name: str,
+                               selfie_file: BinaryIO, selfie_file_name: str, country: str = "IT",
+                               video_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """
+        Submit liveness, ID document and selfie concurrently
+        
+        The three Sumsub calls are independent, so the total wait is the slowest
+        call instead of the sum. No step bookkeeping here - a DB session can't be
+        shared between concurrent tasks, so callers update steps afterwards.
+        
+        Returns:
+            Dict with liveness, id_document and selfie - each the Sumsub response,
+            or the exception that call raised (one failure doesn't abort the others)
+        """
+        liveness, id_document, selfie = await asyncio.gather(
+            self.submit_face_liveness(applicant_id, video_data),
+            self.upload_id_document(applicant_id, id_file, id_file_name, country=country),
+            self.upload_selfie(applicant_id, selfie_file, selfie_file_name),
+            return_exceptions=True
+        )
+        return {"liveness": liveness, "id_document": id_document, "selfie": selfie}
+    
+    async def set_applicant_pending(self, applicant_id: str) -> Dict[str, Any]:
         """
         Move applicant to pending review
         POST /resources/applicants/{applicantId}/status/pending
@@ -346,12 +546,10 @@ class SumsubService:
         method = "POST"
         path = f"/resources/applicants/{applicant_id}/status/pending"
         
-        headers = prepare_headers(method, path, "", self.api_key, self.api_secret)
+        headers = self._headers_for(method, path)
         
-        response = requests.post(
-            f"{self.base_url}{path}",
-            headers=headers
-        )
+        response = await self._request("POST", path, headers=headers)
+        self.invalidate_applicant(applicant_id)
         
         if response.status_code != 200:
             raise SumsubAPIError(
@@ -362,7 +560,7 @@ class SumsubService:
         
         return response.json()
     
-    def create_sdk_token(self, external_user_id: str, 
+    async def create_sdk_token(self, external_user_id: str, 
                         email: str = "", phone: str = "", 
                         ttl_in_secs: int = 600) -> Dict[str, Any]:
         """
@@ -394,14 +592,10 @@ class SumsubService:
         if phone:
             payload["applicantIdentifiers"]["phone"] = phone
         
-        body = json.dumps(payload)
-        headers = prepare_headers(method, path, body, self.api_key, self.api_secret)
+        body = orjson.dumps(payload)
+        headers = self._headers_for(method, path, body)
         
-        response = requests.post(
-            f"{self.base_url}{path}",
-            headers=headers,
-            data=body
-        )
+        response = await self._request("POST", path, headers=headers, content=body)
         
         if response.status_code not in [200, 201]:
             raise SumsubAPIError(
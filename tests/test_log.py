@@ -0,0 +1,54 @@
+import io
+import logging
+import sys
+import unittest
+
+import orjson
+
+from utils.log import JSONFormatter, setup_logging
+
+
+class JSONFormatterTest(unittest.TestCase):
+    def _record(self, **kwargs) -> logging.LogRecord:
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            return logging.getLogger("kyc").makeRecord(
+                "kyc", logging.ERROR, __file__, 1, "failed", None, sys.exc_info(), **kwargs
+            )
+
+    def test_exception_traceback_is_formatted(self):
+        data = orjson.loads(JSONFormatter().format(self._record()))
+        self.assertEqual(data["message"], "failed")
+        self.assertIn("Traceback (most recent call last)", data["exc_info"])
+        self.assertIn("ValueError: bad value", data["exc_info"])
+
+    def test_stack_info_is_formatted(self):
+        record = logging.makeLogRecord({"msg": "here", "stack_info": "Stack (most recent call last):\n  frame"})
+        data = orjson.loads(JSONFormatter().format(record))
+        self.assertIn("frame", data["stack_info"])
+
+    def test_exception_traceback_survives_the_queue(self):
+        stream = io.StringIO()
+        stderr, sys.stderr = sys.stderr, stream
+        try:
+            listener = setup_logging()
+        finally:
+            sys.stderr = stderr
+        try:
+            try:
+                raise ValueError("bad value")
+            except ValueError:
+                logging.getLogger("kyc").exception("failed", extra={"applicant_id": "a1"})
+        finally:
+            listener.stop()
+            logging.getLogger("kyc").handlers = []
+
+        data = orjson.loads(stream.getvalue().splitlines()[-1])
+        self.assertEqual(data["message"], "failed")
+        self.assertEqual(data["applicant_id"], "a1")
+        self.assertIn("ValueError: bad value", data["exc_info"])
+
+
+if __name__ == "__main__":
+    unittest.main()
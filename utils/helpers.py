@@ -1,41 +1,37 @@
 import hmac
 import hashlib
 import json
-import time
-from typing import Dict, Any
+from typing import BinaryIO
 
-def generate_signature(method: str, path: str, body: str, timestamp: int, secret: str) -> str:
-    """Generate HMAC SHA256 signature for Sumsub API"""
-    message = f"{method}{path}{body}{timestamp}"
-    signature = hmac.new(
-        secret.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
-    return signature
-
-def prepare_headers(method: str, path: str, body: str = "", api_key: str = "", api_secret: str = "") -> Dict[str, str]:
-    """Prepare headers with signature for official Sumsub API
+def generate_signature(method: str, path: str, body: bytes, timestamp: int, secret: bytes) -> str:
+    """Generate HMAC SHA256 signature for Sumsub API
     
-    Uses X-App-Token and request signature headers.
-    Signature format: METHOD + path + body + timestamp
+    body is the exact request body bytes and secret the pre-encoded API secret.
     """
-    timestamp = int(time.time())
-    signature = generate_signature(method, path, body, timestamp, api_secret)
+    message = b"".join((method.encode(), path.encode(), body, str(timestamp).encode()))
+    return hmac.new(secret, message, hashlib.sha256).hexdigest()
+
+def file_sha256(file_obj: BinaryIO, chunk_size: int = 64 * 1024) -> str:
+    """SHA-256 hex digest of a whole file object, read in chunks
     
-    headers = {
-        "X-App-Token": api_key,
-        "X-App-Access-Ts": str(timestamp),
-        "X-App-Access-Sig": signature,
-        "Content-Type": "application/json"
-    }
-    return headers
+    Rewinds the file before and after hashing so it can be sent afterwards.
+    """
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    while chunk := file_obj.read(chunk_size):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
 
-def verify_webhook_signature(payload: str, signature: str, secret: str) -> bool:
-    """Verify Sumsub webhook signature"""
-    expected_signature = hmac.new(
-        secret.encode(),
-        payload.encode(),
-        hashlib.sha256
-    ).hexdigest()
-    return hmac.compare_digest(signature, expected_signature)
+def verify_webhook_mac(mac: "hmac.HMAC", signature: str) -> bool:
+    """Check a webhook HMAC that has been fed the whole raw body against its signature
+    
+    Compares the raw digest bytes rather than hex strings.
+    """
+    if len(signature) != mac.digest_size * 2:
+        return False
+    try:
+        expected = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    return hmac.compare_digest(mac.digest(), expected)
@@ -0,0 +1,73 @@
+"""
+Logging setup - records are queued by the caller and formatted/written as JSON
+by a background listener thread, keeping stdout I/O off the event loop
+"""
+
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+class JSONFormatter(logging.Formatter):
+    """Format a record (including `extra=` fields) as one JSON line"""
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return orjson.dumps(data, default=str).decode()
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler that keeps tracebacks out of the message text
+    
+    The stdlib prepare() appends the traceback to the message; here it is
+    rendered into exc_text so JSONFormatter can emit it as its own field.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """Attach a queue handler to the "kyc" logger and start its listener
+    
+    Returns the listener so the caller can stop() it on shutdown.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JSONFormatter())
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    logger = logging.getLogger("kyc")
+    logger.setLevel(level)
+    logger.handlers = [_QueueHandler(log_queue)]
+    logger.propagate = False
+    
+    listener.start()
+    return listener
@@ -1,41 +1,46 @@
 #!/usr/bin/env python
 """Verify database setup and tables"""
 
+import asyncio
+from itertools import groupby
 from database import engine
 from sqlalchemy import text
 
-def verify_database():
+async def verify_database():
     """Check database connection and tables"""
     try:
-        with engine.connect() as conn:
-            # Query tables
-            result = conn.execute(text(
-                "SELECT tablename FROM pg_tables WHERE schemaname = 'public' ORDER BY tablename"
+        async with engine.connect() as conn:
+            # Query all public columns in one round-trip
+            result = await conn.execute(text(
+                "SELECT table_name, column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = 'public' ORDER BY table_name, ordinal_position"
             ))
-            tables = [row[0] for row in result]
+            schemas = [
+                (table, [(row.column_name, row.data_type) for row in rows])
+                for table, rows in groupby(result, key=lambda r: r.table_name)
+            ]
             
             print("\n✅ Database Connection: SUCCESS")
             print("\n📊 Tables Created:")
-            for table in tables:
+            for table, _ in schemas:
                 print(f"   • {table}")
             
-            print(f"\n✨ Total Tables: {len(tables)}")
+            print(f"\n✨ Total Tables: {len(schemas)}")
             
             # Check table schemas
             print("\n📋 Table Schemas:")
-            for table in tables:
-                result = conn.execute(text(
-                    f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{table}' ORDER BY ordinal_position"
-                ))
+            for table, columns in schemas:
                 print(f"\n   {table}:")
-                for col_name, col_type in result:
+                for col_name, col_type in columns:
                     print(f"      - {col_name}: {col_type}")
             
     except Exception as e:
         print(f"\n❌ Database Error: {e}")
         return False
+    finally:
+        await engine.dispose()
     
     return True
 
 if __name__ == "__main__":
-    verify_database()
+    asyncio.run(verify_database())